@@ -1,8 +1,16 @@
 # -*- coding: utf-8 -*-
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import streamlit as st
 import pandas as pd
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy step below is used instead
+    njit = prange = None
+
 # ---------------- Parameters ----------------
 POP_SIZE = 300
 GENE_LENGTH = 80
@@ -15,41 +23,147 @@ ELITE = 2
 TOUR_K = 3
 SEED = 42
 
-rng = np.random.default_rng(SEED)
-
-# Fitness (OneMax)
+# Bit-packed chromosome layout: each 80-bit genome is stored as WORDS uint64
+# words (little-endian bit order), so the whole population is a compact
+# (POP_SIZE, WORDS) array instead of one int cell per bit.
+WORDS = (GENE_LENGTH + 63) // 64
+_PAD_BITS = WORDS * 64 - GENE_LENGTH
+# Word-wise mask that zeroes the unused high bits of the last word.
+GENOME_MASK = np.full(WORDS, ~np.uint64(0), dtype=np.uint64)
+GENOME_MASK[-1] >>= np.uint64(_PAD_BITS)
+# PREFIX_MASKS[i] has the first i genome bits set; a two-point segment
+# [a, b) is then just PREFIX_MASKS[b] ^ PREFIX_MASKS[a].
+_prefix_bits = np.tril(
+    np.ones((GENE_LENGTH + 1, GENE_LENGTH), dtype=np.uint8), k=-1
+)
+PREFIX_MASKS = np.packbits(
+    np.pad(_prefix_bits, ((0, 0), (0, _PAD_BITS))), axis=1, bitorder="little"
+).view(np.uint64)
+
+def pack_bits(bits):
+    """Pack a (..., GENE_LENGTH) 0/1 array into (..., WORDS) uint64 words."""
+    bits = np.atleast_2d(bits).astype(np.uint8)
+    padded = np.pad(bits, ((0, 0), (0, _PAD_BITS)))
+    return np.packbits(padded, axis=1, bitorder="little").view(np.uint64)
+
+def unpack_bits(words):
+    """Unpack (..., WORDS) uint64 words back into a (..., GENE_LENGTH) 0/1 array."""
+    words = np.atleast_2d(words)
+    return np.unpackbits(
+        words.view(np.uint8), axis=1, bitorder="little", count=GENE_LENGTH
+    )
+
+# Fitness (OneMax) — popcount over the packed words. int32 halves the
+# bandwidth of the default uint64 sum and is ample for GENE_LENGTH bits.
 def fitness(pop):
-    return np.sum(pop, axis=1)
-
-def init_population():
-    return rng.integers(0, 2, size=(POP_SIZE, GENE_LENGTH))
-
-def tournament_selection(pop, fit):
-    candidates = rng.choice(len(pop), TOUR_K, replace=False)
-    return pop[candidates[np.argmax(fit[candidates])]]
-
-# Two-point crossover
-def crossover(p1, p2):
-    if rng.random() < PC:
-        p1_idx, p2_idx = sorted(rng.integers(1, GENE_LENGTH, 2))
-        c1 = np.concatenate([p1[:p1_idx], p2[p1_idx:p2_idx], p1[p2_idx:]])
-        c2 = np.concatenate([p2[:p1_idx], p1[p1_idx:p2_idx], p2[p2_idx:]])
-        return c1, c2
-    return p1.copy(), p2.copy()
-
-def mutation(child):
-    flip = rng.random(GENE_LENGTH) < PM
-    child[flip] ^= 1
-    return child
-
-def run_ga():
-    population = init_population()
+    return np.bitwise_count(pop).sum(axis=1, dtype=np.int32)
+
+@st.cache_resource
+def _fitness_pool():
+    """One worker pool per app process, created on first parallel use."""
+    return ProcessPoolExecutor(max_workers=os.cpu_count())
+
+def parallel_fitness(population, fitness_fn=fitness):
+    """Evaluate fitness across processes, one population chunk per core.
+
+    For OneMax the popcount is far cheaper than the pickling, so run_ga
+    keeps the serial path by default; pass parallel=True when plugging an
+    expensive fitness_fn into run_ga.
+    """
+    chunks = np.array_split(population, os.cpu_count() or 1)
+    return np.concatenate(list(_fitness_pool().map(fitness_fn, chunks)))
+
+def init_population(rng, pop_size):
+    pop = rng.integers(0, 1 << 64, size=(pop_size, WORDS), dtype=np.uint64)
+    return pop & GENOME_MASK
+
+# One generation of breeding: tournaments, two-point crossover and mutation
+# fused into a single pass over preallocated buffers. All randomness comes in
+# as pre-drawn arrays so the jitted and NumPy paths stay seed-reproducible.
+def _step_kernel(pop, next_pop, fit, tour_idx, cx_mask, mut_mask):
+    n_pairs = cx_mask.shape[0]
+    n_offspring = next_pop.shape[0]
+    for i in prange(n_pairs):
+        w1 = tour_idx[2 * i, 0]
+        w2 = tour_idx[2 * i + 1, 0]
+        for k in range(1, tour_idx.shape[1]):
+            if fit[tour_idx[2 * i, k]] > fit[w1]:
+                w1 = tour_idx[2 * i, k]
+            if fit[tour_idx[2 * i + 1, k]] > fit[w2]:
+                w2 = tour_idx[2 * i + 1, k]
+        for w in range(pop.shape[1]):
+            m = cx_mask[i, w]
+            a = pop[w1, w]
+            b = pop[w2, w]
+            next_pop[2 * i, w] = ((a & ~m) | (b & m)) ^ mut_mask[2 * i, w]
+            if 2 * i + 1 < n_offspring:
+                next_pop[2 * i + 1, w] = ((b & ~m) | (a & m)) ^ mut_mask[2 * i + 1, w]
+
+def _step_numpy(pop, next_pop, fit, tour_idx, cx_mask, mut_mask):
+    n_winners = len(tour_idx)
+    winners = tour_idx[np.arange(n_winners), fit[tour_idx].argmax(axis=1)]
+    p1 = pop[winners[0::2]]
+    p2 = pop[winners[1::2]]
+    # XOR-swap form of masked crossover — c1 = p1 ^ d, c2 = p2 ^ d with
+    # d = (p1 ^ p2) & mask — written straight into next_pop, so no
+    # intermediate children array or ~mask temporary is allocated.
+    d = np.bitwise_xor(p1, p2)
+    d &= cx_mask
+    odd = next_pop[1::2]
+    np.bitwise_xor(p1[: len(next_pop[0::2])], d[: len(next_pop[0::2])], out=next_pop[0::2])
+    np.bitwise_xor(p2[: len(odd)], d[: len(odd)], out=odd)
+    next_pop ^= mut_mask
+
+ga_step = (
+    njit(parallel=True, fastmath=True, cache=True)(_step_kernel)
+    if njit is not None
+    else _step_numpy
+)
+
+def generation_randoms(rng, pop_size, pc, pm, tour_k, n_offspring, n_pairs):
+    """Draw every random number one generation needs, in four bulk calls.
+
+    Tournament candidates are drawn with replacement: far cheaper than
+    rng.choice(..., replace=False) and the standard GA tournament semantics
+    (a duplicate candidate just competes against itself).
+    """
+    tour_idx = rng.integers(0, pop_size, size=(2 * n_pairs, tour_k), dtype=np.int32)
+    pts = np.sort(rng.integers(1, GENE_LENGTH, size=(n_pairs, 2)), axis=1)
+    cx_mask = PREFIX_MASKS[pts[:, 1]] ^ PREFIX_MASKS[pts[:, 0]]
+    cx_mask[rng.random(n_pairs) >= pc] = 0  # pairs that skip crossover
+    mut_mask = pack_bits(rng.random((n_offspring, GENE_LENGTH)) < pm)
+    return tour_idx, cx_mask, mut_mask
+
+# Cached on its parameters: pressing Run again with an unchanged
+# configuration replays the stored result instead of re-running the GA.
+# st.cache_data can't hash plain functions, so fitness_fn enters the cache
+# key by qualified name — without this the hook would raise
+# UnhashableParamError for any non-default fitness function.
+@st.cache_data(
+    show_spinner="Running genetic algorithm...",
+    hash_funcs={"builtins.function": lambda f: f"{f.__module__}.{f.__qualname__}"},
+)
+def run_ga(pop_size=POP_SIZE, max_gen=MAX_GEN, pc=PC, pm=PM,
+           elite=ELITE, tour_k=TOUR_K, seed=SEED,
+           fitness_fn=fitness, parallel=False):
+    rng = np.random.default_rng(seed)
+    population = init_population(rng, pop_size)
     history = []
 
-    progress = st.progress(0)
+    if parallel:
+        evaluate = lambda pop: parallel_fitness(pop, fitness_fn)
+    else:
+        evaluate = fitness_fn
+
+    n_offspring = pop_size - elite
+    n_pairs = (n_offspring + 1) // 2
+
+    # Double buffer: offspring are written into next_population and the two
+    # arrays are swapped each generation, so no per-generation allocations.
+    next_population = np.empty_like(population)
 
-    for gen in range(MAX_GEN):
-        fit = fitness(population)
+    for gen in range(max_gen):
+        fit = evaluate(population)
 
         history.append({
             "Generation": gen + 1,
@@ -57,24 +171,21 @@ def run_ga():
             "Average Fitness": fit.mean()
         })
 
-        # Elitism
-        elite_idx = np.argsort(fit)[-ELITE:]
-        elites = population[elite_idx]
+        # Elitism (argpartition is O(N); the elites need no ordering)
+        elite_idx = np.argpartition(fit, -elite)[-elite:]
 
-        new_population = []
-
-        while len(new_population) < POP_SIZE - ELITE:
-            parent1 = tournament_selection(population, fit)
-            parent2 = tournament_selection(population, fit)
-            child1, child2 = crossover(parent1, parent2)
-            new_population.append(mutation(child1))
-            if len(new_population) < POP_SIZE - ELITE:
-                new_population.append(mutation(child2))
+        # Whole-generation breeding: every tournament, crossover point and
+        # mutation mask is drawn up front, then fed to the fused step.
+        tour_idx, cx_mask, mut_mask = generation_randoms(
+            rng, pop_size, pc, pm, tour_k, n_offspring, n_pairs
+        )
 
-        population = np.vstack([new_population, elites])
-        progress.progress((gen + 1) / MAX_GEN)
+        ga_step(population, next_population[:n_offspring], fit,
+                tour_idx, cx_mask, mut_mask)
+        next_population[n_offspring:] = population[elite_idx]
+        population, next_population = next_population, population
 
-    final_fit = fitness(population)
+    final_fit = evaluate(population)
     best_index = np.argmax(final_fit)
 
     return pd.DataFrame(history), population[best_index], final_fit[best_index]
@@ -132,7 +243,9 @@ if run:
         st.progress(best_fitness / GENE_LENGTH)
 
         st.markdown("**Best Chromosome (Binary Representation):**")
-        st.code("".join(best_solution.astype(str)), language="text")
+        # One C-level memcpy: 0/1 bytes + ord('0') are already ASCII digits.
+        best_bits = unpack_bits(best_solution)[0]
+        st.code((best_bits + ord("0")).tobytes().decode("ascii"), language="text")
 
     # Optional expandable section
     with st.expander("📊 Show Fitness History Table"):
@@ -2,21 +2,12 @@
 # app.py
 import json
 from typing import List, Dict, Any, Tuple
-import operator
+import numpy as np
 import streamlit as st
 
 # ----------------------------
-# 1) Rule Engine (UNCHANGED)
+# 1) Rule Engine
 # ----------------------------
-OPS = {
-    "==": operator.eq,
-    "!=": operator.ne,
-    ">": operator.gt,
-    ">=": operator.ge,
-    "<": operator.lt,
-    "<=": operator.le,
-}
-
 DEFAULT_RULES: List[Dict[str, Any]] = [
     {
         "name": "Windows open → AC OFF",
@@ -115,23 +106,90 @@ DEFAULT_RULES: List[Dict[str, Any]] = [
     }
 ]
 
-def evaluate_condition(facts: Dict[str, Any], cond: List[Any]) -> bool:
-    field, op, value = cond
-    if field not in facts or op not in OPS:
-        return False
-    return OPS[op](facts[field], value)
+# Numeric codes for the supported comparison operators; the np.select in
+# run_rules dispatches on these, in this order.
+OP_CODES = {"==": 0, "!=": 1, ">": 2, ">=": 3, "<": 4, "<=": 5}
+
+def _encode_value(value: Any, vocab: Dict[Any, int], grow: bool = False) -> float:
+    """Map a fact/condition value onto the numeric axis the matrix works in.
+
+    Numbers and booleans pass through; strings get a vocabulary code (only
+    equality-style operators make sense on those). Values outside the
+    vocabulary — unknown strings, None — encode to NaN, which no ordered or
+    equality condition ever holds against.
+    """
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    if grow:
+        return float(vocab.setdefault(value, len(vocab)))
+    return float(vocab.get(value, np.nan))
+
+def compile_rules(rules: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compile the rule base into flat NumPy condition columns at load time.
+
+    Rules are sorted by priority once, then every condition becomes one row
+    of (rule index, field index, op code, threshold), so a single vectorized
+    comparison evaluates the whole rule base against the current facts.
+    """
+    ordered = sorted(rules, key=lambda r: r["priority"], reverse=True)
+    fields: List[str] = []
+    vocab: Dict[Any, int] = {}
+    cond_rule, cond_field, cond_op, cond_value = [], [], [], []
 
-def rule_matches(facts: Dict[str, Any], rule: Dict[str, Any]) -> bool:
-    return all(evaluate_condition(facts, condition) for condition in rule["conditions"])
+    for i, rule in enumerate(ordered):
+        for field, op, value in rule["conditions"]:
+            if field not in fields:
+                fields.append(field)
+            cond_rule.append(i)
+            cond_field.append(fields.index(field))
+            cond_op.append(OP_CODES[op])
+            cond_value.append(_encode_value(value, vocab, grow=True))
+
+    return {
+        "rules": ordered,
+        "fields": fields,
+        "vocab": vocab,
+        "cond_rule": np.array(cond_rule),
+        "cond_field": np.array(cond_field),
+        "cond_op": np.array(cond_op),
+        "cond_value": np.array(cond_value),
+        "n_conds": np.bincount(cond_rule, minlength=len(ordered)),
+    }
+
+COMPILED_RULES = compile_rules(DEFAULT_RULES)
 
 def run_rules(
     facts: Dict[str, Any],
-    rules: List[Dict[str, Any]]
+    compiled: Dict[str, Any] = COMPILED_RULES,
+    collect_matches: bool = True
 ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
 
-    matched_rules = [r for r in rules if rule_matches(facts, r)]
+    # Evaluate every condition of every rule in one vectorized comparison: a
+    # rule fires when all of its condition rows hold.
+    fact_vec = np.array([
+        _encode_value(facts.get(field), compiled["vocab"])
+        for field in compiled["fields"]
+    ])
+    present = np.array([field in facts for field in compiled["fields"]])
+    x = fact_vec[compiled["cond_field"]]
+    v = compiled["cond_value"]
+    op = compiled["cond_op"]
+    holds = np.select(
+        [op == 0, op == 1, op == 2, op == 3, op == 4],
+        [x == v, x != v, x > v, x >= v, x < v],
+        default=(x <= v),
+    )
+    # A condition on a missing fact never holds, matching the original
+    # evaluate_condition's `field not in facts` guard.
+    holds &= present[compiled["cond_field"]]
+    fires = (
+        np.bincount(compiled["cond_rule"], holds, minlength=len(compiled["rules"]))
+        == compiled["n_conds"]
+    )
 
-    if not matched_rules:
+    if not fires.any():
         return {
             "mode": "OFF",
             "fan_speed": "AUTO",
@@ -139,8 +197,17 @@ def run_rules(
             "reason": "No rule satisfied"
         }, []
 
-    matched_rules.sort(key=lambda r: r["priority"], reverse=True)
-    return matched_rules[0]["action"], matched_rules
+    # compiled["rules"] is already priority-sorted, so no per-call sort is
+    # needed and the first fired rule is the winning action.
+    best = compiled["rules"][int(fires.argmax())]
+
+    # The UI lists every matched rule; callers that only need the decision
+    # can pass collect_matches=False and skip building that list.
+    if not collect_matches:
+        return best["action"], [best]
+
+    matched_rules = [rule for rule, fired in zip(compiled["rules"], fires) if fired]
+    return best["action"], matched_rules
 
 
 # ----------------------------
@@ -194,7 +261,7 @@ with right:
     st.subheader("🤖 System Decision")
 
     if run:
-        action, fired_rules = run_rules(facts, DEFAULT_RULES)
+        action, fired_rules = run_rules(facts)
 
         # Action summary using metrics
         m1, m2, m3 = st.columns(3)
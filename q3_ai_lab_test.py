@@ -1,10 +1,12 @@
+import os
+from pathlib import Path
+
 import streamlit as st
+import numpy as np
 import torch
 import torchvision.models as models
-import torchvision.transforms as transforms
 import torch.nn.functional as F
 from PIL import Image
-import requests
 import pandas as pd
 
 # -------------------------------
@@ -23,16 +25,27 @@ st.caption("Powered by Pretrained ResNet-18 (ImageNet)")
 # -------------------------------
 device = torch.device("cpu")
 
+# Thread tuning: Streamlit deployments often inherit a poor default intra-op
+# thread count. Half the logical cores sidesteps hyperthread thrashing, and
+# one interop thread is enough for a single inference stream.
+torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+try:
+    torch.set_num_interop_threads(1)
+except RuntimeError:
+    # Already set — Streamlit re-executes this script on every interaction.
+    pass
+torch.backends.mkldnn.enabled = True
+
 # -------------------------------
-# Step 2: Load ImageNet labels
+# Step 2: Load ImageNet labels (bundled with the app, no network fetch)
 # -------------------------------
-LABELS_URL = "https://raw.githubusercontent.com/pytorch/hub/master/imagenet_classes.txt"
+LABELS_PATH = Path(__file__).parent / "imagenet_classes.txt"
 @st.cache_data
-def load_labels(url):
-    response = requests.get(url)
-    return response.text.splitlines()
+def load_labels():
+    # A numpy array so top-k indices can fancy-index the labels directly.
+    return np.array(LABELS_PATH.read_text().splitlines())
 
-imagenet_labels = load_labels(LABELS_URL)
+imagenet_labels = load_labels()
 
 # -------------------------------
 # Step 3: Load pretrained model
@@ -41,6 +54,20 @@ imagenet_labels = load_labels(LABELS_URL)
 def load_model():
     model = models.resnet18(weights=models.ResNet18_Weights.DEFAULT)
     model.eval()
+    # Post-training dynamic int8 quantization of the classifier head: the
+    # int8 matmul uses VNNI dot-products where available and shrinks those
+    # weights 4x. Static quantization of the convolutions would need a
+    # calibration image set, which this app doesn't ship.
+    model = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+    # Channels-last + frozen TorchScript lets oneDNN fuse Conv-BN-ReLU and
+    # run vectorized NHWC kernels instead of eager per-layer dispatch.
+    model = model.to(memory_format=torch.channels_last)
+    model = torch.jit.freeze(torch.jit.script(model))
+    # Warm-up pass so the first capture doesn't pay the JIT/fusion cost.
+    with torch.inference_mode():
+        model(torch.zeros(1, 3, 224, 224).contiguous(memory_format=torch.channels_last))
     return model
 
 model = load_model().to(device)
@@ -48,15 +75,20 @@ model = load_model().to(device)
 # -------------------------------
 # Step 4: Image preprocessing
 # -------------------------------
-transform = transforms.Compose([
-    transforms.Resize((256, 256)),
-    transforms.CenterCrop(224),
-    transforms.ToTensor(),
-    transforms.Normalize(
-        mean=[0.485, 0.456, 0.406],
-        std=[0.229, 0.224, 0.225]
-    )
-])
+# Normalization fused into one multiply-add over the cropped image:
+# (x / 255 - mean) / std  ==  x * SCALE + BIAS
+_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+SCALE = (1.0 / (255.0 * _STD)).reshape(3, 1, 1)
+BIAS = (-_MEAN / _STD).reshape(3, 1, 1)
+
+def preprocess(image):
+    """Resize, center-crop and normalize into a CHW tensor in one NumPy pass."""
+    img = image.resize((256, 256)).crop((16, 16, 240, 240))
+    arr = np.asarray(img, dtype=np.uint8).transpose(2, 0, 1).astype(np.float32)
+    arr *= SCALE
+    arr += BIAS
+    return torch.from_numpy(arr)
 
 # -------------------------------
 # Step 5: Capture image
@@ -69,13 +101,17 @@ if captured_image:
 
     st.image(image, caption="Input Image", use_container_width=True)
 
-    input_tensor = transform(image)
-    input_batch = input_tensor.unsqueeze(0).to(device)
+    input_tensor = preprocess(image)
+    input_batch = (
+        input_tensor.unsqueeze(0)
+        .to(device)
+        .contiguous(memory_format=torch.channels_last)
+    )
 
     # -------------------------------
     # Step 6: Prediction
     # -------------------------------
-    with torch.no_grad():
+    with torch.inference_mode():
         logits = model(input_batch)
 
     probs = F.softmax(logits.squeeze(), dim=0)
@@ -83,8 +119,8 @@ if captured_image:
     top_probs, top_indices = torch.topk(probs, k=5)
 
     results = pd.DataFrame({
-        "Class": [imagenet_labels[i] for i in top_indices],
-        "Confidence": (top_probs * 100).cpu().numpy()
+        "Class": imagenet_labels[top_indices.cpu().numpy()],
+        "Confidence": top_probs.cpu().numpy() * 100.0
     })
 
     # -------------------------------